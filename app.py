@@ -1,8 +1,15 @@
 """Streamlit app for Azure DevOps Work Item Automation."""
 
-import json
+import gzip
+import hashlib
+import io
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
 
+import orjson
+import requests
 import streamlit as st
+import zstandard
 
 from create_work_items import (
     SCHEMA_PATH,
@@ -10,11 +17,14 @@ from create_work_items import (
     AzureDevOpsError,
     Summary,
     build_config,
+    compile_schema,
     get_work_item_types,
     process_epics,
     validate_input,
 )
 
+MAX_PLAN_BYTES = 50 * 1024 * 1024  # Largest plan accepted after decompression
+
 st.set_page_config(page_title="Azure DevOps Work Items", page_icon=":clipboard:")
 st.title("Azure DevOps Work Item Creator")
 
@@ -30,41 +40,211 @@ def _get_config() -> dict:
     )
 
 
-# ── Input ──────────────────────────────────────────────────────────────────
+@st.cache_resource
+def _get_client(org_url: str, project: str, pat: str) -> AzureDevOpsClient:
+    """Return an AzureDevOpsClient shared by every session in this process.
+
+    The client's pooled HTTP connections are reused across reruns and
+    browser tabs. Any change to the config values builds a new client.
+    """
+    return AzureDevOpsClient(org_url, project, pat)
+
+
+@st.cache_resource
+def _schema_warmup() -> Future:
+    """Start compiling the plan schema once per process, on a background thread.
+
+    Called before the input widgets are built, so the compile overlaps with
+    rendering the page and with the user picking a plan. It only fills
+    compile_schema's cache: validation still goes through compile_schema,
+    so a failed compile is retried and a changed schema file is picked up.
+    """
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(compile_schema, SCHEMA_PATH)
+    executor.shutdown(wait=False)
+    return future
 
-tab_upload, tab_paste = st.tabs(["Upload file", "Paste JSON"])
 
-with tab_upload:
-    uploaded = st.file_uploader("Upload a project plan JSON file", type=["json"])
+_schema_warmup()
 
-with tab_paste:
+
+# ── Input ──────────────────────────────────────────────────────────────────
+
+# Only the selected input widget is created, so the other one is not
+# serialized and sent to the browser on every rerun
+source = st.radio("Input source", ["Upload file", "Paste JSON"], horizontal=True)
+
+uploaded = None
+json_text = ""
+if source == "Upload file":
+    uploaded = st.file_uploader(
+        "Upload a project plan JSON file (optionally .gz or .zst compressed)",
+        type=["json", "gz", "zst"],
+    )
+else:
     json_text = st.text_area(
         "Paste your project plan JSON",
         height=300,
         placeholder='{"metadata": {...}, "epics": [...]}',
     )
 
-# Determine which input source to use
-data = None
-if uploaded:
+
+# ── Parse + validate (cached per input) ───────────────────────────────────
+
+def _decompress(raw: bytes | memoryview, filename: str) -> bytes | memoryview:
+    """Decompress a ``.gz`` or ``.zst`` upload; other files pass through.
+
+    At most MAX_PLAN_BYTES are inflated, so a small compressed upload cannot
+    exhaust memory; larger output raises ValueError.
+    """
+    if filename.endswith(".gz"):
+        with gzip.GzipFile(fileobj=io.BytesIO(raw)) as reader:
+            data = reader.read(MAX_PLAN_BYTES + 1)
+    elif filename.endswith(".zst"):
+        # stream_reader copes with frames that don't record their size
+        with zstandard.ZstdDecompressor().stream_reader(raw) as reader:
+            data = reader.read(MAX_PLAN_BYTES + 1)
+    else:
+        return raw
+    if len(data) > MAX_PLAN_BYTES:
+        raise ValueError(
+            f"decompressed size exceeds the {MAX_PLAN_BYTES // (1024 * 1024)} MB limit"
+        )
+    return data
+
+
+def _load_plan(
+    raw: bytes | memoryview, error_prefix: str, filename: str = ""
+) -> tuple:
+    """Parse and validate a plan, reusing the result across reruns.
+
+    Streamlit re-executes this script on every interaction, so the parsed
+    plan is kept in ``st.session_state`` keyed by a hash of the raw input
+    (before decompression). Only the latest plan is kept to bound memory.
+
+    Returns ``(key, data, errors)``.
+    """
+    key = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    cached = st.session_state.get("plan_cache", {}).get(key)
+    if cached is not None:
+        return cached
+
     try:
-        data = json.load(uploaded)
-    except json.JSONDecodeError as exc:
-        st.error(f"Invalid JSON in uploaded file: {exc}")
+        raw = _decompress(raw, filename)
+    except (OSError, EOFError, ValueError, zlib.error, zstandard.ZstdError) as exc:
+        st.error(f"Could not decompress {filename}: {exc}")
         st.stop()
-elif json_text.strip():
+
     try:
-        data = json.loads(json_text)
-    except json.JSONDecodeError as exc:
-        st.error(f"Invalid JSON: {exc}")
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError as exc:
+        st.error(f"{error_prefix}: {exc}")
         st.stop()
 
-if data is None:
+    # Wait for the warm-up rather than compiling a second time alongside
+    # it; its outcome is ignored, validate_input compiles again if it failed
+    _schema_warmup().exception()
+    errors, _ = validate_input(data, SCHEMA_PATH)
+    entry = (key, data, errors)
+    st.session_state["plan_cache"] = {key: entry}
+    return entry
+
+
+@st.cache_data(show_spinner=False, max_entries=32, ttl=3600)
+def _summarize_plan(plan_key: str, _data: dict) -> tuple:
+    """Count the work items of a validated plan and build its header.
+
+    Memoized on ``plan_key`` (the hash of the raw input); Streamlit skips
+    hashing the leading-underscore ``_data`` argument, so a cache hit costs
+    no walk over the plan. The cache is shared by every session, so it is
+    bounded in size and age.
+
+    Returns ``(counts, wit, header)`` where ``counts`` maps
+    'epic'/'issue'/'task' to totals and ``header`` is the markdown for the
+    project title, description and totals.
+    """
+    meta = _data["metadata"]
+    wit = get_work_item_types(meta)
+    epics = _data["epics"]
+    issue_count = task_count = 0
+    for epic in epics:
+        issues = epic["issues"]
+        issue_count += len(issues)
+        for issue in issues:
+            task_count += len(issue["tasks"])
+
+    counts = {"epic": len(epics), "issue": issue_count, "task": task_count}
+
+    header = [f"### {meta['project']} v{meta['version']}"]
+    if meta.get("description"):
+        header.append(f":gray[{meta['description']}]")
+    header.append(
+        f"**{counts['epic']}** {wit['epic']}(s), **{issue_count}** {wit['issue']}(s), "
+        f"**{task_count}** {wit['task']}(s)"
+    )
+
+    return counts, wit, "\n\n".join(header)
+
+
+@st.cache_data(show_spinner=False, max_entries=8, ttl=3600)
+def _preview_rows(plan_key: str, _data: dict, _wit: dict) -> list[dict]:
+    """Build the preview rows of a validated plan, memoized on ``plan_key``.
+
+    Kept apart from _summarize_plan so the per-task rows are only built and
+    unpickled when the preview is shown. Returns one row per task (or per
+    issue without tasks).
+    """
+    wit_epic = _wit["epic"]
+    wit_issue = _wit["issue"]
+    wit_task = _wit["task"]
+    rows: list[dict] = []
+
+    for epic in _data["epics"]:
+        epic_title = epic["title"]
+        for issue in epic["issues"]:
+            issue_title = issue["title"]
+            tasks = issue["tasks"]
+            owners = issue.get("ownerUserIds")
+            owner = owners[0] if owners else None
+            if not tasks:
+                rows.append(
+                    {
+                        wit_epic: epic_title,
+                        wit_issue: issue_title,
+                        wit_task: None,
+                        "Owner": owner,
+                    }
+                )
+            for task in tasks:
+                task_owners = task.get("ownerUserIds")
+                rows.append(
+                    {
+                        wit_epic: epic_title,
+                        wit_issue: issue_title,
+                        wit_task: task["title"],
+                        # Same rule as process_epics: tasks inherit the issue owner
+                        "Owner": task_owners[0] if task_owners else owner,
+                    }
+                )
+
+    return rows
+
+
+# Determine which input source to use
+if uploaded:
+    # getbuffer() exposes the upload without copying it, so the raw bytes
+    # and the parsed plan are not both duplicated in memory while parsing
+    with uploaded.getbuffer() as buf:
+        plan_key, data, errors = _load_plan(
+            buf, "Invalid JSON in uploaded file", uploaded.name
+        )
+elif json_text.strip():
+    plan_key, data, errors = _load_plan(json_text.encode("utf-8"), "Invalid JSON")
+else:
     st.info("Upload a `.json` file or paste JSON to get started.")
     st.stop()
 
 # Validate
-errors = validate_input(data, SCHEMA_PATH)
 if errors:
     st.error("Validation errors:")
     for err in errors:
@@ -73,31 +253,15 @@ if errors:
 
 # ── Preview tree ────────────────────────────────────────────────────────────
 
-meta = data["metadata"]
-wit = get_work_item_types(meta)
-st.subheader(f"{meta['project']} v{meta['version']}")
-if meta.get("description"):
-    st.caption(meta["description"])
-
-epic_count = len(data["epics"])
-issue_count = sum(len(e["issues"]) for e in data["epics"])
-task_count = sum(len(t["tasks"]) for e in data["epics"] for t in e["issues"])
-st.markdown(f"**{epic_count}** {wit['epic']}(s), **{issue_count}** {wit['issue']}(s), **{task_count}** {wit['task']}(s)")
-
-for epic in data["epics"]:
-    with st.expander(f"{wit['epic']}: {epic['title']}", expanded=True):
-        if epic.get("ownerUserIds"):
-            st.markdown(f"*Owner:* `{epic['ownerUserIds'][0]}`")
-        if epic.get("description"):
-            st.caption(epic["description"])
-        for issue in epic["issues"]:
-            owner = issue.get("ownerUserIds", [None])[0] if issue.get("ownerUserIds") else None
-            owner_text = f"  \n*Owner:* `{owner}`" if owner else ""
-            st.markdown(f"**{wit['issue']}:** {issue['title']}{owner_text}")
-            if issue.get("description"):
-                st.caption(issue["description"])
-            for task in issue["tasks"]:
-                st.markdown(f"- {task['title']}")
+counts, wit, header = _summarize_plan(plan_key, data)
+st.markdown(header)
+
+# The preview is opt-in, and rendered as a single dataframe: the browser
+# virtualizes its rows, so large plans don't produce one DOM node per task
+if st.checkbox("Preview plan tree", value=False):
+    st.dataframe(
+        _preview_rows(plan_key, data, wit), use_container_width=True, hide_index=True
+    )
 
 st.divider()
 
@@ -118,20 +282,17 @@ def _show_summary(summary: Summary):
     c3.metric("Failed", summary.failed)
     if summary.failures:
         st.error("Failures:")
+        if summary.failures_suppressed:
+            st.caption(f"+{summary.failures_suppressed} earlier failures not shown")
         for f in summary.failures:
             st.markdown(f"- {f}")
 
 
 if dry_run:
-    config = {"org_url": "", "project": "", "pat": ""}
-    summary = process_epics(
-        client=None,
-        config=config,
-        epics=data["epics"],
-        dry_run=True,
-        skip_duplicate_check=True,
-        wit=wit,
-    )
+    # Without duplicate checks a dry run creates every item of the plan, so
+    # the totals already computed for the preview are the result
+    summary = Summary()
+    summary.created = counts["epic"] + counts["issue"] + counts["task"]
     st.subheader("Dry Run Results")
     _show_summary(summary)
 
@@ -142,19 +303,18 @@ if create:
         st.error(f"Configuration error: {exc}. Check `.streamlit/secrets.toml`.")
         st.stop()
 
-    client = AzureDevOpsClient(config["org_url"], config["project"], config["pat"])
+    client = _get_client(config["org_url"], config["project"], config["pat"])
 
     with st.spinner("Creating work items in Azure DevOps..."):
         try:
             summary = process_epics(
                 client=client,
-                config=config,
                 epics=data["epics"],
                 dry_run=False,
                 skip_duplicate_check=False,
                 wit=wit,
             )
-        except AzureDevOpsError as exc:
+        except (AzureDevOpsError, requests.RequestException) as exc:
             st.error(f"Azure DevOps API error: {exc}")
             st.stop()
 
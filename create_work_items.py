@@ -12,18 +12,35 @@ Usage:
 """
 
 import argparse
-import json
+import gzip
+import hashlib
 import logging
+import os
+import random
+import re
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 
+import orjson
 import requests
-from dotenv import dotenv_values
-from jsonschema import ValidationError, validate
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 
 logger = logging.getLogger("ado-workitems")
 
 SCHEMA_PATH = "project_plan_schema.json"
+TITLE_CACHE_DIR = Path.home() / ".cache" / "ado_workitems"
+
+# WIQL string literals escape a single quote by doubling it
+_WIQL_ESCAPE = str.maketrans({"'": "''"})
 
 
 # --------------------------------------------------------------------------- #
@@ -44,17 +61,64 @@ def build_config(org_url: str, project: str, pat: str) -> dict:
     return values
 
 
+_CONFIG_KEYS = ("AZURE_DEVOPS_ORG_URL", "AZURE_DEVOPS_PROJECT", "AZURE_DEVOPS_PAT")
+
+
+@lru_cache(maxsize=4)
+def _read_env_file(env_file: str) -> dict[str, str]:
+    """Parse a .env file once per path; later calls reuse the result.
+
+    Understands ``KEY=value`` lines, an optional ``export`` prefix, single-
+    or double-quoted values, ``#`` comment lines and trailing `` #``
+    comments. A missing file yields an empty dict.
+    """
+    try:
+        text = Path(env_file).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return {}
+
+    values: dict[str, str] = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        key, sep, value = line.removeprefix("export ").partition("=")
+        if not sep:
+            continue
+        value = value.strip()
+        quote = value[:1]
+        end = value.find(quote, 1) if quote in ("'", '"') else -1
+        if end != -1:
+            # Anything after the closing quote is a comment
+            value = value[1:end]
+        else:
+            value = value.split(" #", 1)[0].rstrip()
+        values[key.strip()] = value
+    return values
+
+
 def load_config(env_file: str) -> dict:
-    """Load and validate configuration from a .env file."""
-    values = dotenv_values(env_file)
+    """Load and validate configuration from the environment or a .env file.
+
+    Variables already set in the environment take precedence; the file is
+    only read when one of them is missing.
+    """
+    values = {key: os.environ.get(key, "") for key in _CONFIG_KEYS}
+    if not all(values.values()):
+        from_file = _read_env_file(env_file)
+        values = {key: values[key] or from_file.get(key, "") for key in _CONFIG_KEYS}
     try:
         return build_config(
-            values.get("AZURE_DEVOPS_ORG_URL", ""),
-            values.get("AZURE_DEVOPS_PROJECT", ""),
-            values.get("AZURE_DEVOPS_PAT", ""),
+            values["AZURE_DEVOPS_ORG_URL"],
+            values["AZURE_DEVOPS_PROJECT"],
+            values["AZURE_DEVOPS_PAT"],
         )
     except ValueError as exc:
-        logger.error("Configuration error in %s: %s", env_file, exc)
+        logger.error(
+            "Configuration error (read from %s and the environment): %s",
+            env_file,
+            exc,
+        )
         sys.exit(2)
 
 
@@ -64,8 +128,7 @@ def load_config(env_file: str) -> dict:
 
 
 def _load_schema(schema_path: str) -> dict:
-    with open(schema_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return orjson.loads(Path(schema_path).read_bytes())
 
 
 def get_work_item_types(metadata: dict) -> dict[str, str]:
@@ -82,69 +145,124 @@ def get_work_item_types(metadata: dict) -> dict[str, str]:
     }
 
 
-def validate_input(data: dict, schema_path: str) -> list[str]:
-    """Validate parsed JSON data against the schema.
+@lru_cache(maxsize=4)
+def _compile_schema(schema_path: str, mtime: float) -> Validator:
+    schema = _load_schema(schema_path)
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema, format_checker=cls.FORMAT_CHECKER)
 
-    Returns a list of error strings. Empty list means the data is valid.
+
+def compile_schema(schema_path: str) -> Validator:
+    """Return a validator for the schema at ``schema_path``.
+
+    Compiling is far more expensive than validating, so the validator is
+    cached per path and modification time: it is built once, and again
+    only if the schema file changes.
     """
-    schema = _load_schema(schema_path)
+    return _compile_schema(schema_path, os.stat(schema_path).st_mtime)
 
-    try:
-        validate(instance=data, schema=schema)
-    except ValidationError as exc:
-        return [f"Schema validation failed: {exc.message}"]
+
+def validate_input(
+    data: dict,
+    schema_path: str,
+    validator: Validator | None = None,
+    deep: bool = True,
+) -> tuple[list[str], dict[str, int]]:
+    """Validate parsed JSON data against the schema.
+
+    ``validator`` is an already-compiled schema; when omitted the cached
+    validator for ``schema_path`` is used (see compile_schema).
+
+    With ``deep=False`` only the schema is checked: the per-node walk for
+    duplicate IDs and the assignment strategy is skipped, and the counts
+    are taken from the list lengths instead.
+
+    Returns ``(errors, counts)``. ``errors`` is a list of error strings;
+    an empty list means the data is valid. Every schema violation is
+    reported, not just the first one. ``counts`` maps 'epic', 'issue' and
+    'task' to the number of items in the plan, tallied during the same
+    walk (all zero when the schema check fails).
+    """
+    counts = {"epic": 0, "issue": 0, "task": 0}
+    if validator is None:
+        validator = compile_schema(schema_path)
+
+    schema_errors = sorted(validator.iter_errors(data), key=lambda e: e.json_path)
+    if schema_errors:
+        return [
+            f"Schema validation failed at {error.json_path}: {error.message}"
+            for error in schema_errors
+        ], counts
+
+    if not deep:
+        epics = data["epics"]
+        issue_count = task_count = 0
+        for epic in epics:
+            issues = epic["issues"]
+            issue_count += len(issues)
+            for issue in issues:
+                task_count += len(issue["tasks"])
+        counts.update(epic=len(epics), issue=issue_count, task=task_count)
+        return [], counts
 
     errors: list[str] = []
-    wit = get_work_item_types(data["metadata"])
 
-    # Check for duplicate IDs across the entire plan
-    seen_ids: dict[str, str] = {}
+    # Check for duplicate IDs across the entire plan and enforce the
+    # assignment strategy contract in a single walk over the tree.
+    strategy = data["metadata"].get("assignmentStrategy", "issue-owner")
+    check_assigned = strategy == "issue-owner"
+    seen_ids: set[str] = set()
+    issue_count = task_count = 0
     for epic in data["epics"]:
         if epic["id"] in seen_ids:
             errors.append(f"Duplicate ID: {epic['id']}")
-        seen_ids[epic["id"]] = wit["epic"]
-        for issue in epic["issues"]:
+        seen_ids.add(epic["id"])
+        issues = epic["issues"]
+        issue_count += len(issues)
+        for issue in issues:
             if issue["id"] in seen_ids:
                 errors.append(f"Duplicate ID: {issue['id']}")
-            seen_ids[issue["id"]] = wit["issue"]
-            for task in issue["tasks"]:
-                if task["id"] in seen_ids:
-                    errors.append(f"Duplicate ID: {task['id']}")
-                seen_ids[task["id"]] = wit["task"]
+            seen_ids.add(issue["id"])
+            tasks = issue["tasks"]
+            task_count += len(tasks)
+            for task in tasks:
+                task_id = task["id"]
+                if task_id in seen_ids:
+                    errors.append(f"Duplicate ID: {task_id}")
+                seen_ids.add(task_id)
+                if check_assigned and "assignedTo" in task:
+                    errors.append(
+                        f'[{task_id}] task.assignedTo is not allowed '
+                        f'when assignmentStrategy is "issue-owner"'
+                    )
 
-    # Enforce assignment strategy contract
-    strategy = data["metadata"].get("assignmentStrategy", "issue-owner")
-    if strategy == "issue-owner":
-        for epic in data["epics"]:
-            for issue in epic["issues"]:
-                for task in issue["tasks"]:
-                    if "assignedTo" in task:
-                        errors.append(
-                            f'[{task["id"]}] task.assignedTo is not allowed '
-                            f'when assignmentStrategy is "issue-owner"'
-                        )
+    counts.update(epic=len(data["epics"]), issue=issue_count, task=task_count)
+    return errors, counts
 
-    return errors
 
+def load_and_validate_input(
+    filepath: str, schema_path: str, deep: bool = True
+) -> tuple[dict, dict[str, int]]:
+    """Load JSON input file and validate against the schema (CLI entry point).
 
-def load_and_validate_input(filepath: str, schema_path: str) -> dict:
-    """Load JSON input file and validate against the schema (CLI entry point)."""
+    Returns the parsed plan and its item counts (see validate_input).
+    """
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = orjson.loads(Path(filepath).read_bytes())
     except FileNotFoundError:
         logger.error("Input file not found: %s", filepath)
         sys.exit(2)
-    except json.JSONDecodeError as exc:
+    except orjson.JSONDecodeError as exc:
         logger.error("Invalid JSON in %s: %s", filepath, exc)
         sys.exit(2)
 
-    errors = validate_input(data, schema_path)
+    errors, counts = validate_input(data, schema_path, deep=deep)
     if errors:
         logger.error("Input validation errors:\n  %s", "\n  ".join(errors))
         sys.exit(2)
 
-    return data
+    return data, counts
 
 
 # --------------------------------------------------------------------------- #
@@ -152,6 +270,30 @@ def load_and_validate_input(filepath: str, schema_path: str) -> dict:
 # --------------------------------------------------------------------------- #
 
 
+def _title_key(work_item_type: str, title: str) -> tuple[str, str]:
+    """Return the duplicate-lookup key of a work item.
+
+    WIQL compares strings case-insensitively, so the title indexes fold case
+    the same way.
+    """
+    return work_item_type.casefold(), title.casefold()
+
+
+_FIELD_PATHS: dict[str, str] = {}
+
+
+def _field_path(name: str) -> str:
+    """Return the JSON Patch path of a field, built and interned once per name.
+
+    Plans repeat the same custom fields on many items, so every patch
+    document shares one string per field instead of formatting a new one.
+    """
+    path = _FIELD_PATHS.get(name)
+    if path is None:
+        path = _FIELD_PATHS[name] = sys.intern(f"/fields/{name}")
+    return path
+
+
 class AzureDevOpsError(Exception):
     """Raised when an Azure DevOps API call fails."""
 
@@ -161,130 +303,432 @@ class AzureDevOpsError(Exception):
         super().__init__(f"HTTP {status_code}: {message}")
 
 
+class _BackoffRetry(Retry):
+    """urllib3 Retry with jittered 1s, 2s, 4s... backoff.
+
+    The jitter keeps threads that were throttled together from all retrying
+    at the same instant. Throttled responses are logged here; urllib3
+    already warns about each retried connection error.
+    """
+
+    def get_backoff_time(self) -> float:
+        if not self.history:
+            return 0.0
+        backoff = 2 ** (len(self.history) - 1) + random.uniform(0, self.backoff_jitter)
+        return min(self.backoff_max, backoff)
+
+    def increment(self, *args, **kwargs) -> "Retry":
+        retry = super().increment(*args, **kwargs)
+        status = retry.history[-1].status
+        if status:
+            logger.warning(
+                "HTTP %d. Retrying (attempt %d/%d)...",
+                status,
+                len(retry.history),
+                len(retry.history) + retry.total,
+            )
+        return retry
+
+
 class AzureDevOpsClient:
     """Thin wrapper around requests for Azure DevOps REST API calls."""
 
     API_VERSION = "7.1"
     MAX_RETRIES = 3
+    MAX_BACKOFF = 30  # Upper bound in seconds for a single retry wait
+    BATCH_SIZE = 200  # Maximum sub-requests accepted by the $batch endpoint
+    MAX_CONCURRENT_REQUESTS = 8  # Keeps us under ADO's per-user throttling
+    POOL_SIZE = 16  # Pooled connections (raised to MAX_CONCURRENT_REQUESTS if lower)
+    GZIP_MIN_BYTES = 8192  # Smaller bulk bodies are sent uncompressed
+    WIQL_TITLES_PER_QUERY = 100  # 100 x 255-char titles stays under WIQL's 32K limit
+    WIQL_MAX_RESULTS = 20000  # Larger results are rejected; page with $top
+    _PATCH_HEADERS = {"Content-Type": "application/json-patch+json"}
+    _GZIP_HEADERS = {"Content-Encoding": "gzip"}
 
     def __init__(self, org_url: str, project: str, pat: str):
         self.org_url = org_url
         self.project = project
         self.session = requests.Session()
         self.session.auth = ("", pat)
+        # Most calls send and expect JSON; create_work_item overrides
+        # Content-Type for its JSON Patch body. requests already asks for
+        # gzip/deflate responses and decodes them transparently.
+        self.session.headers.update(
+            {"Content-Type": "application/json", "Accept": "application/json"}
+        )
+        # Keep a pooled keep-alive connection for every request that may be
+        # in flight, so worker threads reuse TLS sessions instead of opening
+        # (and discarding) extra connections.
+        #
+        # 429 (throttled) and 503 (overloaded) responses and failed
+        # connections are retried by urllib3, honouring Retry-After. Errors
+        # after a request was sent are not retried: a POST that timed out
+        # may still have created its work items.
+        retry = _BackoffRetry(
+            total=self.MAX_RETRIES,
+            read=0,
+            status_forcelist=(429, 503),
+            allowed_methods=frozenset({"GET", "POST", "PATCH"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+            backoff_jitter=1.0,
+            backoff_max=self.MAX_BACKOFF,
+        )
+        pool_size = max(self.POOL_SIZE, self.MAX_CONCURRENT_REQUESTS)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retry,
+        )
+        # On-premises Azure DevOps Server is often reached over plain http
+        for prefix in ("https://", "http://"):
+            self.session.mount(prefix, adapter)
+        self._slots = threading.BoundedSemaphore(self.MAX_CONCURRENT_REQUESTS)
+        # Epoch time before which no request is sent (see _track_rate_limit)
+        self._resume_at = 0.0
+
+        # Endpoint URLs only depend on the org and project; build them once
+        # rather than formatting them again for every request
+        api_version = f"api-version={self.API_VERSION}"
+        self._wiql_url = f"{org_url}/{project}/_apis/wit/wiql?{api_version}"
+        self._items_batch_url = (
+            f"{org_url}/{project}/_apis/wit/workitemsbatch?{api_version}"
+        )
+        self._batch_url = f"{org_url}/_apis/wit/$batch?{api_version}"
+        self._create_prefix = f"/{project}/_apis/wit/workitems/$"
+        self._create_suffix = f"?{api_version}"
+        self._create_uris: dict[tuple[str, bool], str] = {}  # See _create_path
+        self._parent_url_prefix = f"{org_url}/_apis/wit/workItems/"
+        # Browser link of a work item: edit_url_prefix + str(id)
+        self.edit_url_prefix = f"{org_url}/{project}/_workitems/edit/"
+        # Every WIQL query starts the same way; callers append their filters
+        self._wiql_select = (
+            "SELECT [System.Id] FROM WorkItems "
+            f"WHERE [System.TeamProject] = '{project.translate(_WIQL_ESCAPE)}' "
+        )
+        # <org>_<project>.json, with anything unsafe in a file name replaced
+        self._cache_name = re.sub(
+            r"[^A-Za-z0-9._-]+", "_", f"{org_url.split('://', 1)[-1]}_{project}"
+        ) + ".json"
 
     def _request(self, method: str, url: str, **kwargs) -> requests.Response:
-        """Make an HTTP request with retry logic for rate limiting and network errors."""
-        for attempt in range(self.MAX_RETRIES + 1):
-            try:
-                resp = self.session.request(method, url, **kwargs)
-
-                if resp.status_code == 429:
-                    retry_after = int(resp.headers.get("Retry-After", 2**attempt))
-                    logger.warning(
-                        "Rate limited. Retrying after %ds (attempt %d/%d)...",
-                        retry_after,
-                        attempt + 1,
-                        self.MAX_RETRIES,
-                    )
-                    time.sleep(retry_after)
-                    continue
+        """Make an HTTP request; retries happen in the session's adapter.
 
-                return resp
-
-            except requests.ConnectionError:
-                if attempt == self.MAX_RETRIES:
-                    raise
-                wait = 2**attempt
-                logger.warning(
-                    "Connection error. Retrying in %ds (attempt %d/%d)...",
-                    wait,
-                    attempt + 1,
-                    self.MAX_RETRIES,
-                )
-                time.sleep(wait)
+        At most MAX_CONCURRENT_REQUESTS requests are in flight per client,
+        however many threads (or Streamlit sessions) share it. Once Azure
+        DevOps reports the rate limit as exhausted, every request waits for
+        the reset instead of being rejected.
+        """
+        pause = self._resume_at - time.time()
+        if pause > 0:
+            time.sleep(pause)
+
+        with self._slots:
+            resp = self.session.request(method, url, **kwargs)
 
-        return resp  # type: ignore[possibly-undefined]
+        self._track_rate_limit(resp)
+        return resp
 
-    def find_existing_work_item(
-        self, title: str, work_item_type: str
-    ) -> int | None:
-        """Check if a work item with the exact title and type already exists.
+    def _track_rate_limit(self, resp: requests.Response) -> None:
+        """Pause upcoming requests when the rate limit is used up.
 
-        Returns the work item ID if found, None otherwise.
+        Azure DevOps sends ``X-RateLimit-Remaining`` and ``X-RateLimit-Reset``
+        (epoch seconds) once a user nears their limit; when nothing remains,
+        requests are held back until the reset rather than sent to be
+        throttled.
         """
-        escaped_title = title.replace("'", "''")
-        wiql = (
-            f"SELECT [System.Id] FROM WorkItems "
-            f"WHERE [System.TeamProject] = '{self.project}' "
-            f"AND [System.WorkItemType] = '{work_item_type}' "
-            f"AND [System.Title] = '{escaped_title}'"
-        )
-        url = (
-            f"{self.org_url}/{self.project}/_apis/wit/wiql"
-            f"?api-version={self.API_VERSION}"
-        )
+        remaining = resp.headers.get("X-RateLimit-Remaining")
+        reset = resp.headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            if float(remaining) > 0:
+                return
+            resume_at = float(reset)
+        except ValueError:
+            return
+        if resume_at > self._resume_at:
+            self._resume_at = resume_at
+            logger.warning(
+                "Rate limit reached. Pausing requests for %.1fs...",
+                max(0.0, resume_at - time.time()),
+            )
 
-        resp = self._request(
-            "POST",
-            url,
-            json={"query": wiql},
-            headers={"Content-Type": "application/json"},
-        )
+    def _json_body(self, payload) -> dict:
+        """Return ``_request`` keyword arguments that send ``payload`` as JSON.
 
+        Bodies of at least GZIP_MIN_BYTES are gzip-compressed; the bulk
+        ``$batch`` and ``workitemsbatch`` payloads shrink several-fold.
+        """
+        body = orjson.dumps(payload)
+        if len(body) < self.GZIP_MIN_BYTES:
+            return {"data": body}
+        return {
+            "data": gzip.compress(body, compresslevel=5),
+            "headers": self._GZIP_HEADERS,
+        }
+
+    def _raise_for_auth(self, resp: requests.Response) -> None:
+        """Raise AzureDevOpsError if the response is an authentication failure."""
         if resp.status_code in (401, 403):
             error_msg = "Authentication failed. Check your PAT and its permissions."
             try:
-                error_msg = resp.json().get("message", error_msg)
+                error_msg = orjson.loads(resp.content).get("message", error_msg)
             except (ValueError, KeyError):
                 pass
             raise AzureDevOpsError(resp.status_code, error_msg)
 
+    def _parse_json(self, resp: requests.Response) -> dict:
+        """Decode a JSON response body.
+
+        Raises AzureDevOpsError if the body is not JSON, e.g. the HTML
+        sign-in page served with a 203 for a bad PAT, or a proxy error page.
+        """
+        try:
+            return orjson.loads(resp.content)
+        except ValueError:
+            content_type = resp.headers.get("Content-Type") or "no content type"
+            raise AzureDevOpsError(
+                resp.status_code,
+                f"Expected a JSON response, got {content_type}. "
+                "Check the organization URL and your PAT.",
+            ) from None
+
+    def _query_ids(self, wiql: str, top: int | None = None) -> list[int]:
+        """Run a WIQL query and return the matching work item IDs.
+
+        ``top`` caps the number of IDs returned.
+        """
+        url = self._wiql_url if top is None else f"{self._wiql_url}&$top={top}"
+        resp = self._request(
+            "POST",
+            url,
+            data=orjson.dumps({"query": wiql}),
+        )
+
+        self._raise_for_auth(resp)
         resp.raise_for_status()
-        work_items = resp.json().get("workItems", [])
-        return work_items[0]["id"] if work_items else None
+        work_items = self._parse_json(resp).get("workItems", [])
+        return [item["id"] for item in work_items]
 
-    def create_work_item(
+    def _index_titles(self, ids: list[int]) -> dict[tuple[str, str], int]:
+        """Read the type and title of ``ids`` through ``workitemsbatch``.
+
+        Returns a dict mapping ``_title_key(work_item_type, title)`` to the
+        work item ID; when several items share a key, the first in ``ids``
+        wins.
+        """
+
+        def fetch_chunk(chunk: list[int]) -> list[dict]:
+            resp = self._request(
+                "POST",
+                self._items_batch_url,
+                **self._json_body(
+                    {
+                        "ids": chunk,
+                        "fields": ["System.Title", "System.WorkItemType"],
+                    }
+                ),
+            )
+
+            self._raise_for_auth(resp)
+            resp.raise_for_status()
+            return self._parse_json(resp).get("value", [])
+
+        chunks = [
+            ids[start : start + self.BATCH_SIZE]
+            for start in range(0, len(ids), self.BATCH_SIZE)
+        ]
+        existing: dict[tuple[str, str], int] = {}
+        if not chunks:
+            return existing
+
+        # Chunks are independent reads; map() keeps them in query order so
+        # the first of several same-titled items wins
+        workers = min(self.MAX_CONCURRENT_REQUESTS, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for items in executor.map(fetch_chunk, chunks):
+                for item in items:
+                    fields = item["fields"]
+                    key = _title_key(
+                        fields["System.WorkItemType"], fields["System.Title"]
+                    )
+                    existing.setdefault(key, item["id"])
+
+        return existing
+
+    def fetch_existing_titles(
+        self, work_item_types: list[str], cache_dir: Path | None = None
+    ) -> dict[tuple[str, str], int]:
+        """Index every existing work item of the given types by type and title.
+
+        With ``cache_dir``, the index is reused from there while the project's
+        IDs and latest ChangedDate are unchanged.
+
+        Returns a dict mapping ``_title_key(work_item_type, title)`` to the ID.
+        """
+        types = ", ".join(
+            "'" + t.translate(_WIQL_ESCAPE) + "'"
+            for t in dict.fromkeys(work_item_types)
+        )
+        type_filter = f"{self._wiql_select}AND [System.WorkItemType] IN ({types}) "
+        # Pages come back in ID order, so the oldest of several same-titled
+        # items wins when indexed
+        ordered: list[int] = []
+        while True:
+            after = ordered[-1] if ordered else 0
+            page = self._query_ids(
+                f"{type_filter}AND [System.Id] > {after} ORDER BY [System.Id]",
+                top=self.WIQL_MAX_RESULTS,
+            )
+            ordered.extend(page)
+            if len(page) < self.WIQL_MAX_RESULTS:
+                break
+        if cache_dir is None:
+            return self._index_titles(ordered)
+
+        latest = (
+            self._query_ids(f"{type_filter}ORDER BY [System.ChangedDate] DESC", top=1)
+            if ordered
+            else []
+        )
+        watermark = {
+            "types": sorted(set(work_item_types)),
+            "ids": hashlib.blake2b(orjson.dumps(ordered), digest_size=16).hexdigest(),
+            "changed": self._changed_date(latest[0]) if latest else None,
+        }
+        cache_path = cache_dir / self._cache_name
+        try:
+            cached = orjson.loads(cache_path.read_bytes())
+            if cached["watermark"] == watermark:
+                logger.info("Using cached work item titles from %s", cache_path)
+                return {
+                    _title_key(wit, title): ado_id
+                    for wit, title, ado_id in cached["items"]
+                }
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        existing = self._index_titles(ordered)
+        snapshot = {
+            "saved_at": time.time(),
+            "watermark": watermark,
+            "items": [
+                [wit, title, ado_id] for (wit, title), ado_id in existing.items()
+            ],
+        }
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            tmp_path.write_bytes(orjson.dumps(snapshot))
+            tmp_path.replace(cache_path)
+        except OSError as exc:
+            logger.warning("Could not write title cache %s: %s", cache_path, exc)
+        return existing
+
+    def lookup_existing_titles(
+        self, titles_by_type: dict[str, list[str]]
+    ) -> dict[tuple[str, str], int]:
+        """Look up existing work items by title, indexing small projects outright.
+
+        Returns a dict mapping ``_title_key(work_item_type, title)`` to the ID.
+        """
+        unique = {title for titles in titles_by_type.values() for title in titles}
+        if not unique:
+            return {}
+        title_queries = -(-len(unique) // self.WIQL_TITLES_PER_QUERY)
+        limit = title_queries * self.BATCH_SIZE
+        if limit >= self.WIQL_MAX_RESULTS:
+            return self.find_existing_titles(titles_by_type)
+
+        types = ", ".join(
+            "'" + t.translate(_WIQL_ESCAPE) + "'" for t in titles_by_type
+        )
+        ids = self._query_ids(
+            f"{self._wiql_select}AND [System.WorkItemType] IN ({types})",
+            top=limit + 1,
+        )
+        if len(ids) <= limit:
+            # Index in ID order so the oldest of several same-titled items wins
+            return self._index_titles(sorted(ids))
+        return self.find_existing_titles(titles_by_type)
+
+    def _changed_date(self, ado_id: int) -> str | None:
+        """Return the System.ChangedDate of one work item."""
+        resp = self._request(
+            "POST",
+            self._items_batch_url,
+            data=orjson.dumps({"ids": [ado_id], "fields": ["System.ChangedDate"]}),
+        )
+
+        self._raise_for_auth(resp)
+        resp.raise_for_status()
+        items = self._parse_json(resp).get("value", [])
+        return items[0]["fields"].get("System.ChangedDate") if items else None
+
+    def find_existing_titles(
+        self, titles_by_type: dict[str, list[str]]
+    ) -> dict[tuple[str, str], int]:
+        """Look up existing work items by the titles a plan is about to create.
+
+        Returns a dict mapping ``_title_key(work_item_type, title)`` to the ID.
+        """
+        types = ", ".join(
+            "'" + t.translate(_WIQL_ESCAPE) + "'" for t in titles_by_type
+        )
+        unique = list(
+            dict.fromkeys(
+                title for titles in titles_by_type.values() for title in titles
+            )
+        )
+        queries: list[str] = []
+        for start in range(0, len(unique), self.WIQL_TITLES_PER_QUERY):
+            chunk = unique[start : start + self.WIQL_TITLES_PER_QUERY]
+            literals = ", ".join(
+                "'" + t.translate(_WIQL_ESCAPE) + "'" for t in chunk
+            )
+            queries.append(
+                f"{self._wiql_select}AND [System.WorkItemType] IN ({types}) "
+                f"AND [System.Title] IN ({literals})"
+            )
+
+        if not queries:
+            return {}
+
+        ids: list[int] = []
+        workers = min(self.MAX_CONCURRENT_REQUESTS, len(queries))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for query_ids in executor.map(self._query_ids, queries):
+                ids.extend(query_ids)
+
+        return self._index_titles(ids)
+
+    def _build_patch_doc(
         self,
-        work_item_type: str,
         title: str,
         description: str | None = None,
         assigned_to: str | None = None,
         parent_id: int | None = None,
         custom_fields: dict | None = None,
-    ) -> dict:
-        """Create a single work item and return the API response dict."""
+    ) -> list[dict]:
+        """Build the JSON Patch document that creates a work item."""
+        # (path, value, include) for the standard fields; the title is
+        # always sent, the optional fields only when set
+        spec = (
+            ("/fields/System.Title", title, True),
+            ("/fields/System.Description", description, bool(description)),
+            ("/fields/System.AssignedTo", assigned_to, bool(assigned_to)),
+        )
         patch_doc = [
-            {"op": "add", "path": "/fields/System.Title", "value": title}
+            {"op": "add", "path": path, "value": value}
+            for path, value, include in spec
+            if include
         ]
-
-        if description:
-            patch_doc.append(
-                {
-                    "op": "add",
-                    "path": "/fields/System.Description",
-                    "value": description,
-                }
-            )
-
-        if assigned_to:
-            patch_doc.append(
-                {
-                    "op": "add",
-                    "path": "/fields/System.AssignedTo",
-                    "value": assigned_to,
-                }
-            )
-
         if custom_fields:
-            for field_name, field_value in custom_fields.items():
-                patch_doc.append(
-                    {
-                        "op": "add",
-                        "path": f"/fields/{field_name}",
-                        "value": field_value,
-                    }
-                )
+            patch_doc += [
+                {"op": "add", "path": _field_path(name), "value": value}
+                for name, value in custom_fields.items()
+            ]
 
         if parent_id is not None:
             patch_doc.append(
@@ -293,7 +737,7 @@ class AzureDevOpsClient:
                     "path": "/relations/-",
                     "value": {
                         "rel": "System.LinkTypes.Hierarchy-Reverse",
-                        "url": f"{self.org_url}/_apis/wit/workItems/{parent_id}",
+                        "url": self._parent_url_prefix + str(parent_id),
                         "attributes": {
                             "comment": "Auto-linked by create_work_items script"
                         },
@@ -301,43 +745,135 @@ class AzureDevOpsClient:
                 }
             )
 
+        return patch_doc
+
+    def _create_path(self, work_item_type: str, custom_fields: dict | None) -> str:
+        """Return the project-relative URI that creates a work item.
+
+        URIs are built once per type (and bypass setting) and reused, so
+        every sub-request of a ``$batch`` for the same type shares one string.
+        """
         # Bypass rules when setting System.State to allow non-initial states
-        bypass = (
-            "&bypassRules=true"
-            if custom_fields and "System.State" in custom_fields
-            else ""
-        )
-        url = (
-            f"{self.org_url}/{self.project}/_apis/wit/workitems"
-            f"/${work_item_type}?api-version={self.API_VERSION}{bypass}"
-        )
+        bypass = bool(custom_fields) and "System.State" in custom_fields
+        uri = self._create_uris.get((work_item_type, bypass))
+        if uri is None:
+            uri = self._create_prefix + work_item_type + self._create_suffix
+            if bypass:
+                uri += "&bypassRules=true"
+            self._create_uris[(work_item_type, bypass)] = uri
+        return uri
 
-        logger.debug("POST %s\n%s", url, json.dumps(patch_doc, indent=2))
+    def create_work_item(
+        self,
+        work_item_type: str,
+        title: str,
+        description: str | None = None,
+        assigned_to: str | None = None,
+        parent_id: int | None = None,
+        custom_fields: dict | None = None,
+    ) -> dict:
+        """Create a single work item and return the API response dict."""
+        patch_doc = self._build_patch_doc(
+            title, description, assigned_to, parent_id, custom_fields
+        )
+        url = self.org_url + self._create_path(work_item_type, custom_fields)
+
+        # Only pretty-print the payload when it will actually be logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "POST %s\n%s",
+                url,
+                orjson.dumps(patch_doc, option=orjson.OPT_INDENT_2).decode(),
+            )
 
         resp = self._request(
             "POST",
             url,
-            json=patch_doc,
-            headers={"Content-Type": "application/json-patch+json"},
+            data=orjson.dumps(patch_doc),
+            headers=self._PATCH_HEADERS,
         )
 
-        if resp.status_code in (401, 403):
-            error_msg = "Authentication failed. Check your PAT and its permissions."
+        self._raise_for_auth(resp)
+
+        if resp.status_code >= 400:
+            error_msg = resp.text
             try:
-                error_msg = resp.json().get("message", error_msg)
+                error_msg = orjson.loads(resp.content).get("message", resp.text)
             except (ValueError, KeyError):
                 pass
             raise AzureDevOpsError(resp.status_code, error_msg)
 
+        return self._parse_json(resp)
+
+    def create_work_items_batch(
+        self, items: list[dict]
+    ) -> list[dict | AzureDevOpsError]:
+        """Create up to BATCH_SIZE work items in a single ``$batch`` request.
+
+        Each item is a dict of create_work_item keyword arguments. Returns
+        one entry per item, in order: the created work item dict, or an
+        AzureDevOpsError if that item was rejected. The batch is not
+        transactional, so some items may succeed while others fail.
+        """
+        if len(items) > self.BATCH_SIZE:
+            raise ValueError(
+                f"At most {self.BATCH_SIZE} work items per batch, got {len(items)}"
+            )
+
+        body = [
+            {
+                "method": "PATCH",
+                "uri": self._create_path(
+                    item["work_item_type"], item.get("custom_fields")
+                ),
+                "headers": self._PATCH_HEADERS,
+                "body": self._build_patch_doc(
+                    item["title"],
+                    item.get("description"),
+                    item.get("assigned_to"),
+                    item.get("parent_id"),
+                    item.get("custom_fields"),
+                ),
+            }
+            for item in items
+        ]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "POST %s\n%s",
+                self._batch_url,
+                orjson.dumps(body, option=orjson.OPT_INDENT_2).decode(),
+            )
+
+        resp = self._request(
+            "POST",
+            self._batch_url,
+            **self._json_body(body),
+        )
+
+        self._raise_for_auth(resp)
+
         if resp.status_code >= 400:
             error_msg = resp.text
             try:
-                error_msg = resp.json().get("message", resp.text)
+                error_msg = orjson.loads(resp.content).get("message", resp.text)
             except (ValueError, KeyError):
                 pass
             raise AzureDevOpsError(resp.status_code, error_msg)
 
-        return resp.json()
+        results: list[dict | AzureDevOpsError] = []
+        for entry in self._parse_json(resp)["value"]:
+            payload = entry.get("body")
+            if isinstance(payload, str):
+                try:
+                    payload = orjson.loads(payload)
+                except ValueError:
+                    pass
+            if entry["code"] >= 400:
+                message = payload.get("message") if isinstance(payload, dict) else None
+                results.append(AzureDevOpsError(entry["code"], message or str(payload)))
+            else:
+                results.append(payload)
+        return results
 
 
 # --------------------------------------------------------------------------- #
@@ -348,11 +884,14 @@ class AzureDevOpsClient:
 class Summary:
     """Tracks creation results."""
 
+    MAX_FAILURES = 1000  # Failure messages kept; older ones are only counted
+
     def __init__(self):
         self.created = 0
         self.skipped = 0
         self.failed = 0
-        self.failures: list[str] = []
+        self.failures: deque[str] = deque(maxlen=self.MAX_FAILURES)
+        self.failures_suppressed = 0
 
     def record_created(self, local_id: str, title: str, ado_id: int, url: str):
         self.created += 1
@@ -372,6 +911,8 @@ class Summary:
     def record_failed(self, local_id: str, title: str, error: str):
         self.failed += 1
         msg = f'[{local_id}] "{title}": {error}'
+        if len(self.failures) == self.MAX_FAILURES:
+            self.failures_suppressed += 1
         self.failures.append(msg)
         logger.error("  FAILED   %s", msg)
 
@@ -398,184 +939,245 @@ class Summary:
         print(f"  Failed:              {self.failed}")
         if self.failures:
             print("\nFailures:")
+            if self.failures_suppressed:
+                print(f"  ... (+{self.failures_suppressed} earlier ones suppressed)")
             for f in self.failures:
                 print(f"  - {f}")
 
 
-def _get_work_item_url(org_url: str, project: str, ado_id: int) -> str:
-    return f"{org_url}/{project}/_workitems/edit/{ado_id}"
+@dataclass(slots=True)
+class WorkItemSpec:
+    """One work item of the plan, flattened out of the Epic -> Issue -> Task tree."""
 
+    local_id: str
+    title: str
+    description: str | None
+    fields: dict | None
+    owner: str | None
+    parent_local: str | None  # Local ID of the parent; None for epics
 
-def process_epics(
-    client: AzureDevOpsClient,
-    config: dict,
-    epics: list[dict],
-    dry_run: bool,
-    skip_duplicate_check: bool,
-    wit: dict[str, str],
-) -> Summary:
-    """Process the full Epic -> Issue -> Task tree.
 
-    ``wit`` maps logical roles ('epic', 'issue', 'task') to the
-    Azure DevOps work item type names to use.
-    """
+def build_level_queue(epics: list[dict]) -> dict[str, list[WorkItemSpec]]:
+    """Flatten the plan tree into one list of specs per level.
 
-    summary = Summary()
-    dry_counter = 0
+    Returns a dict with keys 'epic', 'issue' and 'task', each holding the
+    items of that level in plan order. Tasks without their own owner
+    inherit the issue owner (issue-owner strategy). Identical ``fields``
+    blocks, common across the tasks of a plan, are shared by every spec
+    that uses them instead of being kept once per node.
+    """
+    queue: dict[str, list[WorkItemSpec]] = {"epic": [], "issue": [], "task": []}
+    epic_specs = queue["epic"]
+    issue_specs = queue["issue"]
+    task_specs = queue["task"]
+    canonical_fields: dict[tuple, dict] = {}
+
+    def shared_fields(node: dict) -> dict | None:
+        fields = node.get("fields")
+        if not fields:
+            return fields
+        # The value type is part of the key so that 1, 1.0 and True stay apart
+        key = tuple(
+            sorted((name, type(value), value) for name, value in fields.items())
+        )
+        return canonical_fields.setdefault(key, fields)
 
     for epic in epics:
-        epic_id_local = epic["id"]
-        epic_title = epic["title"]
-        epic_desc = epic.get("description")
-        epic_fields = epic.get("fields")
-        epic_owner = epic["ownerUserIds"][0] if "ownerUserIds" in epic else None
-
-        logger.info("%s: [%s] %s", wit["epic"], epic_id_local, epic_title)
-
-        epic_ado_id = None
-
-        # Duplicate check
-        if not skip_duplicate_check and not dry_run:
-            try:
-                epic_ado_id = client.find_existing_work_item(epic_title, wit["epic"])
-            except AzureDevOpsError as exc:
-                if exc.status_code in (401, 403):
-                    raise
-                summary.record_failed(epic_id_local, epic_title, str(exc))
-
-        if epic_ado_id is not None:
-            summary.record_skipped(epic_id_local, epic_title, epic_ado_id)
-        elif dry_run:
-            dry_counter += 1
-            summary.record_dry_run(
-                epic_id_local, epic_title, wit["epic"], epic_owner, None
+        epic_owners = epic.get("ownerUserIds")
+        epic_specs.append(
+            WorkItemSpec(
+                epic["id"],
+                epic["title"],
+                epic.get("description"),
+                shared_fields(epic),
+                epic_owners[0] if epic_owners else None,
+                None,
             )
-        else:
-            try:
-                result = client.create_work_item(
-                    wit["epic"], epic_title, description=epic_desc,
-                    assigned_to=epic_owner,
-                    custom_fields=epic_fields,
+        )
+        for issue in epic["issues"]:
+            issue_owners = issue.get("ownerUserIds")
+            issue_owner = issue_owners[0] if issue_owners else None
+            issue_specs.append(
+                WorkItemSpec(
+                    issue["id"],
+                    issue["title"],
+                    issue.get("description"),
+                    shared_fields(issue),
+                    issue_owner,
+                    epic["id"],
                 )
-                epic_ado_id = result["id"]
-                url = _get_work_item_url(
-                    config["org_url"], config["project"], epic_ado_id
+            )
+            for task in issue["tasks"]:
+                task_owners = task.get("ownerUserIds")
+                task_specs.append(
+                    WorkItemSpec(
+                        task["id"],
+                        task["title"],
+                        task.get("description"),
+                        shared_fields(task),
+                        task_owners[0] if task_owners else issue_owner,
+                        issue["id"],
+                    )
                 )
-                summary.record_created(epic_id_local, epic_title, epic_ado_id, url)
-            except (AzureDevOpsError, requests.RequestException) as exc:
-                summary.record_failed(epic_id_local, epic_title, str(exc))
-                continue  # Skip issues under this epic
 
-        # Process issues
-        for issue in epic["issues"]:
-            issue_id_local = issue["id"]
-            issue_title = issue["title"]
-            issue_desc = issue.get("description")
-            issue_fields = issue.get("fields")
-            owner = issue["ownerUserIds"][0] if issue.get("ownerUserIds") else None
+    return queue
 
-            logger.info("  %s: [%s] %s", wit["issue"], issue_id_local, issue_title)
 
-            issue_ado_id = None
+def _process_level(
+    client: AzureDevOpsClient,
+    summary: Summary,
+    work_item_type: str,
+    specs: list[WorkItemSpec],
+    parent_type: str | None,
+    parent_ids: dict[str, int | None] | None,
+    dry_run: bool,
+    existing: dict[tuple[str, str], int] | None,
+) -> dict[str, int | None]:
+    """Create one level of the tree, skipping duplicates and orphaned items.
 
-            if not skip_duplicate_check and not dry_run:
-                try:
-                    issue_ado_id = client.find_existing_work_item(
-                        issue_title, wit["issue"]
-                    )
-                except (AzureDevOpsError, requests.RequestException) as exc:
-                    summary.record_failed(issue_id_local, issue_title, str(exc))
-                    continue
+    Returns the Azure DevOps ID of each created or skipped item by local ID
+    (None in dry-run mode); failed items are left out so their children are
+    skipped.
+    """
+    if parent_ids is not None:
+        specs = [spec for spec in specs if spec.parent_local in parent_ids]
+    logger.info("%s(s): %d", work_item_type, len(specs))
+
+    resolved: dict[str, int | None] = {}
+    pending: list[tuple[WorkItemSpec, dict]] = []
+
+    for spec in specs:
+        local_id = spec.local_id
+        title = spec.title
+
+        if dry_run:
+            parent_label = (
+                f"{parent_type} [{spec.parent_local}]"
+                if spec.parent_local is not None
+                else None
+            )
+            summary.record_dry_run(
+                local_id, title, work_item_type, spec.owner, parent_label
+            )
+            resolved[local_id] = None
+            continue
+
+        if existing is not None:
+            existing_id = existing.get(_title_key(work_item_type, title))
+            if existing_id is not None:
+                summary.record_skipped(local_id, title, existing_id)
+                resolved[local_id] = existing_id
+                continue
+
+        pending.append(
+            (
+                spec,
+                {
+                    "work_item_type": work_item_type,
+                    "title": title,
+                    "description": spec.description,
+                    "assigned_to": spec.owner,
+                    "parent_id": (
+                        parent_ids[spec.parent_local]
+                        if spec.parent_local is not None
+                        else None
+                    ),
+                    "custom_fields": spec.fields,
+                },
+            )
+        )
 
-            if issue_ado_id is not None:
-                summary.record_skipped(issue_id_local, issue_title, issue_ado_id)
-            elif dry_run:
-                dry_counter += 1
-                summary.record_dry_run(
-                    issue_id_local,
-                    issue_title,
-                    wit["issue"],
-                    owner,
-                    f"{wit['epic']} [{epic_id_local}]",
+    batch_size = AzureDevOpsClient.BATCH_SIZE
+    chunks = [
+        pending[start : start + batch_size]
+        for start in range(0, len(pending), batch_size)
+    ]
+    if not chunks:
+        return resolved
+
+    def create_chunk(chunk: list[tuple[WorkItemSpec, dict]]) -> list:
+        try:
+            return client.create_work_items_batch([item for _, item in chunk])
+        except (AzureDevOpsError, requests.RequestException) as exc:
+            return [exc] * len(chunk)
+
+    # Batches of the same level are independent, so send them concurrently.
+    # Results are consumed here, on the calling thread, so Summary needs
+    # no locking.
+    edit_url_prefix = client.edit_url_prefix
+    workers = min(AzureDevOpsClient.MAX_CONCURRENT_REQUESTS, len(chunks))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for chunk, results in zip(chunks, executor.map(create_chunk, chunks)):
+            for (spec, _), result in zip(chunk, results):
+                if isinstance(result, Exception):
+                    summary.record_failed(spec.local_id, spec.title, str(result))
+                    continue
+                ado_id = result["id"]
+                summary.record_created(
+                    spec.local_id, spec.title, ado_id, edit_url_prefix + str(ado_id)
                 )
-            else:
-                try:
-                    result = client.create_work_item(
-                        wit["issue"],
-                        issue_title,
-                        description=issue_desc,
-                        assigned_to=owner,
-                        parent_id=epic_ado_id,
-                        custom_fields=issue_fields,
-                    )
-                    issue_ado_id = result["id"]
-                    url = _get_work_item_url(
-                        config["org_url"], config["project"], issue_ado_id
-                    )
-                    summary.record_created(
-                        issue_id_local, issue_title, issue_ado_id, url
-                    )
-                except (AzureDevOpsError, requests.RequestException) as exc:
-                    summary.record_failed(issue_id_local, issue_title, str(exc))
-                    continue  # Skip tasks under this issue
+                resolved[spec.local_id] = ado_id
+
+    return resolved
 
-            # Process tasks
-            for task in issue["tasks"]:
-                task_id_local = task["id"]
-                task_title = task["title"]
-                task_desc = task.get("description")
-                task_fields = task.get("fields")
-                task_owner = (
-                    task["ownerUserIds"][0]
-                    if "ownerUserIds" in task
-                    else owner  # issue-owner strategy: inherit from issue
-                )
 
-                logger.info("    %s: [%s] %s", wit["task"], task_id_local, task_title)
+def process_epics(
+    client: AzureDevOpsClient,
+    epics: list[dict],
+    dry_run: bool,
+    skip_duplicate_check: bool,
+    wit: dict[str, str],
+    title_cache_dir: Path | None = None,
+) -> Summary:
+    """Process the full Epic -> Issue -> Task tree.
 
-                task_ado_id = None
+    The tree is flattened into one queue of WorkItemSpec per level (see
+    build_level_queue) and processed one level at a time, so each level can
+    be created with as few ``$batch`` requests as possible; children need
+    the IDs of their parents, so a level only starts once the previous one
+    is done. Issues under a failed epic and tasks under a failed issue are
+    skipped.
 
-                if not skip_duplicate_check and not dry_run:
-                    try:
-                        task_ado_id = client.find_existing_work_item(
-                            task_title, wit["task"]
-                        )
-                    except (AzureDevOpsError, requests.RequestException) as exc:
-                        summary.record_failed(task_id_local, task_title, str(exc))
-                        continue
+    ``wit`` maps logical roles ('epic', 'issue', 'task') to the
+    Azure DevOps work item type names to use.
 
-                if task_ado_id is not None:
-                    summary.record_skipped(
-                        task_id_local, task_title, task_ado_id
-                    )
-                elif dry_run:
-                    dry_counter += 1
-                    summary.record_dry_run(
-                        task_id_local,
-                        task_title,
-                        wit["task"],
-                        task_owner,
-                        f"{wit['issue']} [{issue_id_local}]",
-                    )
-                else:
-                    try:
-                        result = client.create_work_item(
-                            wit["task"],
-                            task_title,
-                            description=task_desc,
-                            assigned_to=task_owner,
-                            parent_id=issue_ado_id,
-                            custom_fields=task_fields,
-                        )
-                        task_ado_id = result["id"]
-                        url = _get_work_item_url(
-                            config["org_url"], config["project"], task_ado_id
-                        )
-                        summary.record_created(
-                            task_id_local, task_title, task_ado_id, url
-                        )
-                    except (AzureDevOpsError, requests.RequestException) as exc:
-                        summary.record_failed(task_id_local, task_title, str(exc))
+    Duplicate detection looks up every title of the plan up front, either
+    many titles per query or by indexing a small project outright (see
+    AzureDevOpsClient.lookup_existing_titles), instead of querying per item.
+    With ``title_cache_dir``, the whole project index is used instead and
+    cached on disk between runs (see AzureDevOpsClient.fetch_existing_titles).
+    """
+
+    summary = Summary()
+    queue = build_level_queue(epics)
+
+    existing = None
+    if not skip_duplicate_check and not dry_run:
+        logger.info("Fetching existing work items for duplicate detection ...")
+        if title_cache_dir is not None:
+            existing = client.fetch_existing_titles(
+                list(wit.values()), cache_dir=title_cache_dir
+            )
+        else:
+            titles: dict[str, list[str]] = {}
+            for role, specs in queue.items():
+                titles.setdefault(wit[role], []).extend(spec.title for spec in specs)
+            existing = client.lookup_existing_titles(titles)
+
+    parent_type = None
+    parent_ids = None
+    for role in ("epic", "issue", "task"):
+        parent_ids = _process_level(
+            client,
+            summary,
+            wit[role],
+            queue[role],
+            parent_type,
+            parent_ids,
+            dry_run,
+            existing,
+        )
+        parent_type = wit[role]
 
     return summary
 
@@ -633,6 +1235,15 @@ def parse_args() -> argparse.Namespace:
         default=False,
         help="Skip duplicate detection for faster execution",
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        default=False,
+        help=(
+            "Cache existing work item titles in "
+            f"{TITLE_CACHE_DIR} and reuse them while the project is unchanged"
+        ),
+    )
     return parser.parse_args()
 
 
@@ -649,22 +1260,23 @@ def main():
 
     # Load and validate
     logger.info("Loading input from %s ...", args.input)
-    data = load_and_validate_input(args.input, args.schema)
+    # A dry run without duplicate checks only previews the plan, so the
+    # per-node checks are left to the real run
+    data, counts = load_and_validate_input(
+        args.input,
+        args.schema,
+        deep=not (args.dry_run and args.no_duplicate_check),
+    )
     logger.info(
         "Validated: %d epic(s), %d issue(s), %d task(s)",
-        len(data["epics"]),
-        sum(len(e["issues"]) for e in data["epics"]),
-        sum(
-            len(t["tasks"])
-            for e in data["epics"]
-            for t in e["issues"]
-        ),
+        counts["epic"],
+        counts["issue"],
+        counts["task"],
     )
 
     if args.dry_run:
         logger.info("\n*** DRY RUN — no work items will be created ***\n")
         client = None  # type: ignore[assignment]
-        config = {"org_url": "", "project": "", "pat": ""}
     else:
         config = load_config(args.env_file)
         client = AzureDevOpsClient(
@@ -673,14 +1285,18 @@ def main():
 
     # Process
     wit = get_work_item_types(data["metadata"])
-    summary = process_epics(
-        client,
-        config,
-        data["epics"],
-        dry_run=args.dry_run,
-        skip_duplicate_check=args.no_duplicate_check,
-        wit=wit,
-    )
+    try:
+        summary = process_epics(
+            client,
+            data["epics"],
+            dry_run=args.dry_run,
+            skip_duplicate_check=args.no_duplicate_check,
+            wit=wit,
+            title_cache_dir=TITLE_CACHE_DIR if args.cache else None,
+        )
+    except (AzureDevOpsError, requests.RequestException) as exc:
+        logger.error("Azure DevOps API error: %s", exc)
+        sys.exit(1)
 
     summary.print_report()
 
@@ -0,0 +1,175 @@
+import gzip
+import json
+import re
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import pytest
+
+from create_work_items import AzureDevOpsClient
+
+_LITERAL = re.compile(r"'((?:[^']|'')*)'")
+
+
+def _literals(text):
+    return [value.replace("''", "'") for value in _LITERAL.findall(text)]
+
+
+def _in_clause(field, query):
+    match = re.search(rf"\[{re.escape(field)}\] IN \(([^)]*)\)", query)
+    return None if match is None else {v.casefold() for v in _literals(match[1])}
+
+
+class FakeAzureDevOps:
+    """In-memory Azure DevOps project behind a local HTTP server.
+
+    Understands the WIQL filters, ``workitemsbatch`` and ``$batch`` requests
+    the client sends. Like the real service, title and type comparisons
+    ignore case and a WIQL query matching more than ``max_results`` items
+    without a smaller ``$top`` is rejected.
+    """
+
+    def __init__(self):
+        self.items = {}  # id -> {"type", "title", "changed", "parent"}
+        self.next_id = 100
+        self.fail_titles = set()
+        self.max_results = 20000
+        self.calls = []  # (endpoint, query string) per request served
+        self.queries = []  # WIQL text of every wiql request
+        self.scripted = deque()  # (status, headers) answered before the rest
+        self.lock = threading.Lock()
+
+    def add(self, work_item_type, title, parent=None):
+        with self.lock:
+            self.next_id += 1
+            self.items[self.next_id] = {
+                "type": work_item_type,
+                "title": title,
+                "changed": f"2026-01-01T00:00:{self.next_id % 60:02d}Z",
+                "parent": parent,
+            }
+            return self.next_id
+
+    def endpoint_calls(self, endpoint):
+        return sum(1 for name, _ in self.calls if name == endpoint)
+
+    def handle(self, path, query, body):
+        endpoint = path.rsplit("/", 1)[-1]
+        self.calls.append((endpoint, query))
+        if self.scripted:
+            status, headers = self.scripted.popleft()
+            return status, headers, {"message": "throttled"}
+        if endpoint == "wiql":
+            top = parse_qs(query).get("$top")
+            return self._wiql(body["query"], int(top[0]) if top else None)
+        if endpoint == "workitemsbatch":
+            return 200, {}, self._read(body)
+        if endpoint == "$batch":
+            return 200, {}, self._create(body)
+        return 404, {}, {"message": f"unknown endpoint {path}"}
+
+    def _wiql(self, query, top):
+        self.queries.append(query)
+        types = _in_clause("System.WorkItemType", query)
+        titles = _in_clause("System.Title", query)
+        after = re.search(r"\[System\.Id\] > (\d+)", query)
+        ids = [
+            ado_id
+            for ado_id, item in sorted(self.items.items())
+            if (types is None or item["type"].casefold() in types)
+            and (titles is None or item["title"].casefold() in titles)
+            and (after is None or ado_id > int(after[1]))
+        ]
+        if "ORDER BY [System.ChangedDate] DESC" in query:
+            ids.sort(key=lambda ado_id: self.items[ado_id]["changed"], reverse=True)
+        if len(ids) > self.max_results and (top is None or top > self.max_results):
+            return 400, {}, {"message": "VS402337: query result size limit exceeded"}
+        if top is not None:
+            ids = ids[:top]
+        return 200, {}, {"workItems": [{"id": ado_id} for ado_id in ids]}
+
+    def _read(self, body):
+        value = [
+            {
+                "id": ado_id,
+                "fields": {
+                    "System.WorkItemType": self.items[ado_id]["type"],
+                    "System.Title": self.items[ado_id]["title"],
+                    "System.ChangedDate": self.items[ado_id]["changed"],
+                },
+            }
+            for ado_id in body["ids"]
+            if ado_id in self.items
+        ]
+        return {"count": len(value), "value": value}
+
+    def _create(self, body):
+        value = []
+        for request in body:
+            work_item_type = unquote(request["uri"].split("$", 1)[1].split("?")[0])
+            fields = {
+                op["path"]: op["value"]
+                for op in request["body"]
+                if op["path"].startswith("/fields/")
+            }
+            title = fields["/fields/System.Title"]
+            if title in self.fail_titles:
+                error = {"message": f"Rejected {title}"}
+                value.append({"code": 400, "body": json.dumps(error)})
+                continue
+            parent = next(
+                (
+                    int(op["value"]["url"].rsplit("/", 1)[1])
+                    for op in request["body"]
+                    if op["path"] == "/relations/-"
+                ),
+                None,
+            )
+            ado_id = self.add(work_item_type, title, parent)
+            value.append({"code": 200, "body": json.dumps({"id": ado_id})})
+        return {"count": len(value), "value": value}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        raw = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.headers.get("Content-Encoding") == "gzip":
+            raw = gzip.decompress(raw)
+        url = urlsplit(self.path)
+        status, headers, payload = self.server.fake.handle(
+            url.path, url.query, json.loads(raw) if raw else None
+        )
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_ado():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.fake = FakeAzureDevOps()
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    server.fake.org_url = f"http://127.0.0.1:{server.server_port}/org"
+    yield server.fake
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(fake_ado):
+    return AzureDevOpsClient(fake_ado.org_url, "Project", "pat")
@@ -0,0 +1,77 @@
+from create_work_items import _title_key
+
+
+def test_title_key_ignores_case():
+    assert _title_key("Issue", "Set up CI/CD Pipelines") == _title_key(
+        "issue", "SET UP ci/cd pipelines"
+    )
+
+
+def test_title_key_keeps_types_apart():
+    assert _title_key("Issue", "Login") != _title_key("Task", "Login")
+
+
+def test_small_project_is_indexed_outright(fake_ado, client):
+    for title in ("Alpha", "Beta", "Gamma"):
+        fake_ado.add("Task", title)
+
+    existing = client.lookup_existing_titles({"Task": ["Alpha"]})
+
+    assert set(existing) == {
+        _title_key("Task", title) for title in ("Alpha", "Beta", "Gamma")
+    }
+    assert len(fake_ado.queries) == 1
+    assert "[System.Title]" not in fake_ado.queries[0]
+
+
+def test_large_project_is_matched_by_title(fake_ado, client):
+    client.BATCH_SIZE = 2  # One title query would read at most 2 items
+    ids = {title: fake_ado.add("Task", title) for title in "ABCDE"}
+
+    existing = client.lookup_existing_titles({"Task": ["b", "Z"]})
+
+    assert existing == {_title_key("Task", "B"): ids["B"]}
+    assert "[System.Title] IN ('b', 'Z')" in fake_ado.queries[-1]
+
+
+def test_fetch_pages_past_the_wiql_result_cap(fake_ado, client):
+    fake_ado.max_results = client.WIQL_MAX_RESULTS = 3
+    ids = [fake_ado.add("Task", f"Task {n}") for n in range(7)]
+
+    existing = client.fetch_existing_titles(["Task"])
+
+    assert sorted(existing.values()) == ids
+    assert fake_ado.endpoint_calls("wiql") == 3
+
+
+def test_cached_index_is_reused_until_the_watermark_moves(
+    fake_ado, client, tmp_path
+):
+    first = fake_ado.add("Task", "First")
+    assert client.fetch_existing_titles(["Task"], cache_dir=tmp_path) == {
+        _title_key("Task", "First"): first
+    }
+    reads = fake_ado.endpoint_calls("workitemsbatch")
+
+    # Unchanged project: only the ChangedDate of the latest item is read
+    client.fetch_existing_titles(["Task"], cache_dir=tmp_path)
+    assert fake_ado.endpoint_calls("workitemsbatch") == reads + 1
+
+    # A new item moves the watermark, so the titles are read again
+    second = fake_ado.add("Task", "Second")
+    assert client.fetch_existing_titles(["Task"], cache_dir=tmp_path) == {
+        _title_key("Task", "First"): first,
+        _title_key("Task", "Second"): second,
+    }
+    assert fake_ado.endpoint_calls("workitemsbatch") == reads + 3
+
+
+def test_cached_index_is_refreshed_after_an_edit(fake_ado, client, tmp_path):
+    ado_id = fake_ado.add("Task", "Before")
+    client.fetch_existing_titles(["Task"], cache_dir=tmp_path)
+
+    fake_ado.items[ado_id].update(title="After", changed="2026-02-01T00:00:00Z")
+
+    assert client.fetch_existing_titles(["Task"], cache_dir=tmp_path) == {
+        _title_key("Task", "After"): ado_id
+    }
@@ -0,0 +1,58 @@
+from create_work_items import _read_env_file, load_config
+
+
+def _write(tmp_path, text):
+    path = tmp_path / ".env"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_quoted_value_with_trailing_comment(tmp_path):
+    env_file = _write(
+        tmp_path,
+        'AZURE_DEVOPS_ORG_URL="https://dev.azure.com/x"  # org\n'
+        "AZURE_DEVOPS_PROJECT='My Project' # project\n"
+        "AZURE_DEVOPS_PAT=secret # token\n",
+    )
+    assert _read_env_file(env_file) == {
+        "AZURE_DEVOPS_ORG_URL": "https://dev.azure.com/x",
+        "AZURE_DEVOPS_PROJECT": "My Project",
+        "AZURE_DEVOPS_PAT": "secret",
+    }
+
+
+def test_export_prefix_comments_and_hash_inside_quotes(tmp_path):
+    env_file = _write(
+        tmp_path,
+        "# comment line\n\nexport AZURE_DEVOPS_PAT=\"abc #123\"\nBROKEN LINE\n",
+    )
+    assert _read_env_file(env_file) == {"AZURE_DEVOPS_PAT": "abc #123"}
+
+
+def test_missing_file_is_empty(tmp_path):
+    assert _read_env_file(str(tmp_path / "missing.env")) == {}
+
+
+def test_environment_takes_precedence_over_env_file(tmp_path, monkeypatch):
+    env_file = _write(
+        tmp_path,
+        "AZURE_DEVOPS_ORG_URL=https://dev.azure.com/fromfile\n"
+        "AZURE_DEVOPS_PROJECT=FileProject\n"
+        "AZURE_DEVOPS_PAT=file-pat\n",
+    )
+    monkeypatch.setenv("AZURE_DEVOPS_ORG_URL", "https://dev.azure.com/fromenv")
+    monkeypatch.setenv("AZURE_DEVOPS_PROJECT", "EnvProject")
+    monkeypatch.delenv("AZURE_DEVOPS_PAT", raising=False)
+    config = load_config(env_file)
+    assert config["org_url"] == "https://dev.azure.com/fromenv"
+    assert config["project"] == "EnvProject"
+    assert config["pat"] == "file-pat"
+
+
+def test_env_file_is_not_read_when_environment_is_complete(tmp_path, monkeypatch):
+    monkeypatch.setenv("AZURE_DEVOPS_ORG_URL", "https://dev.azure.com/fromenv")
+    monkeypatch.setenv("AZURE_DEVOPS_PROJECT", "EnvProject")
+    monkeypatch.setenv("AZURE_DEVOPS_PAT", "env-pat")
+    _read_env_file.cache_clear()
+    load_config(str(tmp_path / "missing.env"))
+    assert _read_env_file.cache_info().currsize == 0
@@ -0,0 +1,30 @@
+import pytest
+import requests
+
+from create_work_items import AzureDevOpsClient, AzureDevOpsError
+
+
+def _response(status_code, body, content_type):
+    resp = requests.Response()
+    resp.status_code = status_code
+    resp._content = body
+    resp.headers["Content-Type"] = content_type
+    return resp
+
+
+@pytest.fixture
+def client():
+    return AzureDevOpsClient("https://dev.azure.com/org", "Project", "pat")
+
+
+def test_json_body_is_decoded(client):
+    resp = _response(200, b'{"id": 7}', "application/json")
+    assert client._parse_json(resp) == {"id": 7}
+
+
+def test_html_sign_in_page_raises_api_error(client):
+    resp = _response(203, b"<html>Sign in</html>", "text/html; charset=utf-8")
+    with pytest.raises(AzureDevOpsError) as excinfo:
+        client._parse_json(resp)
+    assert excinfo.value.status_code == 203
+    assert "text/html" in excinfo.value.message
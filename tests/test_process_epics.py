@@ -0,0 +1,62 @@
+import pytest
+
+from create_work_items import process_epics
+
+WIT = {"epic": "Epic", "issue": "Issue", "task": "Task"}
+
+
+def _plan():
+    return [
+        {
+            "id": "E1",
+            "title": "Epic one",
+            "issues": [
+                {
+                    "id": "I1",
+                    "title": "Issue one",
+                    "tasks": [{"id": "T1", "title": "Task one"}],
+                },
+                {
+                    "id": "I2",
+                    "title": "Issue two",
+                    "tasks": [{"id": "T2", "title": "Task two"}],
+                },
+            ],
+        }
+    ]
+
+
+def _by_title(fake_ado):
+    return {item["title"]: (ado_id, item) for ado_id, item in fake_ado.items.items()}
+
+
+def test_partial_batch_failure_skips_the_children(fake_ado, client):
+    fake_ado.fail_titles.add("Issue one")
+
+    summary = process_epics(client, _plan(), False, False, WIT)
+
+    assert (summary.created, summary.skipped, summary.failed) == (3, 0, 1)
+    created = _by_title(fake_ado)
+    assert set(created) == {"Epic one", "Issue two", "Task two"}
+    assert created["Issue two"][1]["parent"] == created["Epic one"][0]
+    assert created["Task two"][1]["parent"] == created["Issue two"][0]
+    assert fake_ado.endpoint_calls("$batch") == 3
+
+
+@pytest.mark.parametrize("use_cache", [False, True])
+def test_title_differing_only_in_case_is_skipped(
+    fake_ado, client, tmp_path, use_cache
+):
+    existing_id = fake_ado.add("issue", "ISSUE TWO")
+
+    summary = process_epics(
+        client,
+        _plan(),
+        False,
+        False,
+        WIT,
+        title_cache_dir=tmp_path if use_cache else None,
+    )
+
+    assert (summary.created, summary.skipped, summary.failed) == (4, 1, 0)
+    assert _by_title(fake_ado)["Task two"][1]["parent"] == existing_id
@@ -0,0 +1,35 @@
+import time
+
+import pytest
+import requests
+
+
+@pytest.fixture
+def retry(fake_ado, client):
+    """The client's urllib3 Retry, with the backoff jitter removed."""
+    retry = client.session.get_adapter(fake_ado.org_url).max_retries
+    retry.backoff_jitter = 0.0  # First backoff is then exactly 1s
+    return retry
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_throttled_request_waits_for_retry_after(fake_ado, client, retry, status):
+    fake_ado.add("Task", "Only")
+    fake_ado.scripted.append((status, {"Retry-After": "2"}))
+
+    started = time.monotonic()
+    existing = client.fetch_existing_titles(["Task"])
+
+    assert len(existing) == 1
+    assert time.monotonic() - started >= 2  # Retry-After, not the 1s backoff
+    assert fake_ado.endpoint_calls("wiql") == 2
+
+
+def test_retries_stop_after_max_retries(fake_ado, client, retry):
+    retry.total = 1
+    fake_ado.scripted.extend([(503, {})] * 2)
+
+    with pytest.raises(requests.HTTPError, match="503"):
+        client.fetch_existing_titles(["Task"])
+
+    assert fake_ado.endpoint_calls("wiql") == 2
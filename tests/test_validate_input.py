@@ -0,0 +1,26 @@
+from pathlib import Path
+
+import orjson
+
+from create_work_items import validate_input
+
+ROOT = Path(__file__).resolve().parent.parent
+SCHEMA_PATH = str(ROOT / "project_plan_schema.json")
+
+
+def _example():
+    return orjson.loads((ROOT / "example_input.json").read_bytes())
+
+
+def test_example_plan_is_valid():
+    errors, counts = validate_input(_example(), SCHEMA_PATH)
+    assert errors == []
+    assert counts["epic"] == len(_example()["epics"])
+
+
+def test_duplicate_id_is_reported_once():
+    data = _example()
+    epic = data["epics"][0]
+    epic["issues"][0]["tasks"][0]["id"] = epic["id"]
+    errors, _ = validate_input(data, SCHEMA_PATH)
+    assert errors == [f"Duplicate ID: {epic['id']}"]